@@ -0,0 +1,174 @@
+"""Times each stage of the DDL generation on synthetic workbooks, per dialect, and writes JSON.
+
+Usage: python benchmarks/bench_generate_ddl.py [--sizes 100,1000,10000,100000,1000000]
+                                               [--db-types POSTGRESQL,ORACLE] [--output results.json]
+
+Stages: excel_read (read_workbook), row_processing (normalize_metadata), type_mapping
+(apply_dialect, with a cold type-mapping cache), fk_validation (resolve_foreign_keys),
+model_build (build_dialect_model, which repeats the two previous stages) and rendering
+(render_ddl, the script exactly as users get it). Peak memory is the tracemalloc peak of each
+stage; pass --no-tracemalloc for timings without its overhead. Generated workbooks are kept
+in --workdir and reused when the parameters match.
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import resource
+import sys
+import time
+import tracemalloc
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from main import (  # noqa: E402
+    SUPPORTED_DB_TYPES,
+    _map_parsed_data_type,
+    apply_dialect,
+    build_dialect_model,
+    normalize_metadata,
+    read_workbook,
+    render_ddl,
+    resolve_excel_engine,
+    resolve_foreign_keys,
+)
+from synthetic_workbook import write_workbook  # noqa: E402
+
+DEFAULT_SIZES = "100,1000,10000,100000,1000000"
+
+
+class StageTimer:
+    """Records the wall time and (optionally) the tracemalloc peak of each stage"""
+
+    def __init__(self, trace_memory=True):
+        self.trace_memory = trace_memory
+        self.stages = {}
+
+    def run(self, name, func, *args):
+        gc.collect()
+        if self.trace_memory:
+            tracemalloc.start()
+        start = time.perf_counter()
+        try:
+            return func(*args)
+        finally:
+            elapsed = time.perf_counter() - start
+            peak = None
+            if self.trace_memory:
+                peak = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+            self.stages[name] = {'seconds': round(elapsed, 6), 'peak_bytes': peak}
+
+
+def workbook_path(workdir, rows, args):
+    name = (f"synthetic_{rows}r_{args.columns_per_table}c_fk{args.fk_density}_"
+            f"cp{args.composite_ratio}_{'schema' if not args.no_schema_column else 'noschema'}_s{args.seed}.xlsx")
+    return os.path.join(workdir, name)
+
+
+def bench_size(path, rows, db_types, engine, trace_memory):
+    """Runs every stage once per dialect for one workbook, returns the result record"""
+    reader = StageTimer(trace_memory)
+    workbook = reader.run("excel_read", read_workbook, path, engine)
+    normalized = reader.run("row_processing", normalize_metadata, workbook['metadata'])
+
+    dialects = {}
+    for db_type in db_types:
+        timer = StageTimer(trace_memory)
+        _map_parsed_data_type.cache_clear()
+        attributes = timer.run("type_mapping", apply_dialect, normalized, db_type)
+        references = timer.run("fk_validation", resolve_foreign_keys, attributes)
+        model = timer.run("model_build", build_dialect_model, normalized, db_type)
+        ddl = timer.run("rendering", render_ddl, db_type, model)
+        dialects[db_type] = {
+            'stages': timer.stages,
+            'tables': len(model['table_info']),
+            'foreign_keys': len(references['foreign_keys']),
+            'dropped_foreign_keys': len(references['dropped']),
+            'ddl_bytes': len(ddl.encode("utf-8")),
+        }
+        del attributes, references, model, ddl
+
+    return {
+        'rows': rows,
+        'metadata_rows': len(workbook['metadata']),
+        'workbook_bytes': os.path.getsize(path),
+        'stages': reader.stages,
+        'dialects': dialects,
+    }
+
+
+def print_record(record):
+    stages = record['stages']
+    print(f"rows={record['rows']:>8}  read {stages['excel_read']['seconds']:8.3f}s  "
+          f"normalize {stages['row_processing']['seconds']:8.3f}s", file=sys.stderr)
+    for db_type, result in record['dialects'].items():
+        timings = "  ".join(f"{name} {stage['seconds']:.3f}s" for name, stage in result['stages'].items())
+        print(f"  {db_type:<11} {timings}  ({result['tables']} tables, {result['foreign_keys']} FKs)",
+              file=sys.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help="Comma-separated Metadata row counts")
+    parser.add_argument("--db-types", default=",".join(SUPPORTED_DB_TYPES))
+    parser.add_argument("--engine", default=None, help="pandas Excel engine (openpyxl, calamine or auto)")
+    parser.add_argument("--columns-per-table", type=int, default=20)
+    parser.add_argument("--fk-density", type=float, default=0.1)
+    parser.add_argument("--composite-ratio", type=float, default=0.2)
+    parser.add_argument("--no-schema-column", action="store_true")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workdir", default=os.path.join("benchmarks", ".workbooks"),
+                        help="Directory for the generated workbooks")
+    parser.add_argument("--no-tracemalloc", action="store_true", help="Do not measure peak memory")
+    parser.add_argument("--output", default="-", help="JSON results file, or '-' for stdout")
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    db_types = [db_type.strip().upper() for db_type in args.db_types.split(",")]
+    engine = resolve_excel_engine(args.engine)
+    os.makedirs(args.workdir, exist_ok=True)
+
+    records = []
+    for rows in sizes:
+        path = workbook_path(args.workdir, rows, args)
+        if not os.path.exists(path):
+            start = time.perf_counter()
+            write_workbook(path, rows, None, args.columns_per_table, args.fk_density, args.composite_ratio,
+                           not args.no_schema_column, args.seed)
+            print(f"generated {path} in {time.perf_counter() - start:.1f}s", file=sys.stderr)
+        record = bench_size(path, rows, db_types, engine, not args.no_tracemalloc)
+        print_record(record)
+        records.append(record)
+
+    results = {
+        'created_at': time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'platform': platform.platform(),
+        'engine': engine,
+        'tracemalloc': not args.no_tracemalloc,
+        'parameters': {
+            'columns_per_table': args.columns_per_table,
+            'fk_density': args.fk_density,
+            'composite_ratio': args.composite_ratio,
+            'schema_column': not args.no_schema_column,
+            'seed': args.seed,
+        },
+        'max_rss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        'results': records,
+    }
+    if args.output == "-":
+        json.dump(results, sys.stdout, indent=2)
+        print()
+    else:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
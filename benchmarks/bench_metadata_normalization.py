@@ -0,0 +1,269 @@
+"""Compares the row-wise (iterrows) metadata loop with the columnar build_metadata_model.
+
+Usage: python benchmarks/bench_metadata_normalization.py [--rows 200000] [--db-type POSTGRESQL]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from main import (  # noqa: E402
+    DEFAULT_SCHEMA_NAME,
+    ForeignKey,
+    Table,
+    build_metadata_model,
+    format_identifier,
+    map_data_type,
+    normalize_name,
+)
+
+RAW_TYPES = ["varchar", "VARCHAR(50)", "int", "bigint", "decimal", "DECIMAL(10,2)",
+             "date", "datetime", "nvarchar", "text", "boolean", None]
+
+
+def make_metadata(rows, columns_per_table=20, fk_every=7, seed=0):
+    """Builds a Metadata-sheet-shaped DataFrame with some schemas, flags and references"""
+    rng = random.Random(seed)
+    records = []
+    for i in range(rows):
+        table_idx, col_idx = divmod(i, columns_per_table)
+        record = {
+            "Table Name": f"table_{table_idx}",
+            "Attribute Name": f"column_{col_idx}" if col_idx != 5 else "CDC_TS",
+            "Data Type and Length": rng.choice(RAW_TYPES),
+            "Is it the Primary Key or part of the Primary Key?": "YES" if col_idx == 0 else "NO",
+            "Is it the LastOperation attribute?": "yes" if col_idx == columns_per_table - 1 else None,
+            "Is it the Timestamp attribute?": "YES " if col_idx == columns_per_table - 2 else "NO",
+            "Reference Table": None,
+            "Reference Attribute": None,
+            "Table Schema": ["dbo", "sales", None, DEFAULT_SCHEMA_NAME][table_idx % 4],
+        }
+        if table_idx and col_idx and col_idx % fk_every == 0:
+            target = rng.randrange(table_idx)
+            if col_idx % 2:
+                record["Reference Table"] = f"table_{target}|table_{table_idx - 1}"
+                record["Reference Attribute"] = "column_0|column_1"
+            else:
+                record["Reference Table"] = f"table_{target}"
+                record["Reference Attribute"] = "column_0"
+        records.append(record)
+    return pd.DataFrame(records)
+
+
+def legacy_build_metadata_model(df_metadata, db_type, default_schema_name=DEFAULT_SCHEMA_NAME):
+    """The original per-row loop from generate_ddl, kept as the reference implementation"""
+    # Track objects
+    table_info = {}
+    foreign_keys = []
+    all_table_names = set()
+    schemas_to_create = set()
+    oracle_schemas_to_create = set()
+
+    # Check if there's a Table Schema column
+    has_table_schema_column = "Table Schema" in df_metadata.columns
+
+    # Process metadata
+    for index, row in df_metadata.iterrows():
+        if pd.isna(row.get("Table Name")) or pd.isna(row.get("Attribute Name")):
+            continue
+            
+        table_name = normalize_name(row["Table Name"])
+        column_name = normalize_name(row["Attribute Name"])
+        
+        # Skip CDC columns for SQL Server
+        if db_type == "SQL_SERVER":
+            cdc_columns = ["CDC_TS", "CDC_operation", "CDC_start_lsn", "CDC_end_lsn", 
+                          "CDC_seqval", "CDC_update_mask", "CDC_command_id"]
+            if any(cdc_col.lower() in column_name.lower() for cdc_col in cdc_columns):
+                continue
+        
+        # Handle schemas for all database types if Table Schema column exists
+        schema_part = default_schema_name  # Default schema
+        if has_table_schema_column and pd.notna(row["Table Schema"]):
+            schema_part = normalize_name(row["Table Schema"])
+            if schema_part:
+                if db_type == "SQL_SERVER" and schema_part.lower() != "dbo":
+                    schemas_to_create.add(schema_part)
+                elif db_type == "ORACLE" and schema_part.lower() != default_schema_name.lower():
+                    oracle_schemas_to_create.add(schema_part)
+        else:
+            # Handle schema in table name (schema.table) if no Table Schema column
+            if '.' in table_name:
+                schema_part, table_part = table_name.split('.', 1)
+                table_name = table_part  # Update table_name to exclude schema
+                if db_type == "SQL_SERVER" and schema_part.lower() != "dbo":
+                    schemas_to_create.add(schema_part)
+                elif db_type == "ORACLE" and schema_part.lower() != default_schema_name.lower():
+                    oracle_schemas_to_create.add(schema_part)
+            else:
+                # Use default schema if not specified and no dot in table name
+                if db_type == "SQL_SERVER":
+                    schema_part = "dbo"
+        
+        # Store schema for all database types
+        if table_name not in table_info:
+            table_info[table_name] = {
+                'columns': [], 
+                'primary_keys': [],
+                'schema': schema_part
+            }
+        elif 'schema' not in table_info[table_name]:
+            table_info[table_name]['schema'] = schema_part
+        
+        all_table_names.add(table_name)
+        
+        # Data type handling
+        default_type = "VARCHAR(255)" if db_type != "ORACLE" else "VARCHAR2(255)"
+        data_type = default_type  
+        if "Data Type and Length" in row and pd.notna(row["Data Type and Length"]):
+            data_type = str(row["Data Type and Length"]).strip()
+        
+        mapped_data_type = map_data_type(db_type, data_type)
+        quoted_column_name = format_identifier(column_name, db_type)
+        
+        # Check constraints
+        is_primary_key = False
+        if "Is it the Primary Key or part of the Primary Key?" in row and pd.notna(row["Is it the Primary Key or part of the Primary Key?"]):
+            is_primary_key = str(row["Is it the Primary Key or part of the Primary Key?"]).strip().upper() == "YES"
+        
+        is_last_operation = False
+        if "Is it the LastOperation attribute?" in row and pd.notna(row["Is it the LastOperation attribute?"]):
+            is_last_operation = str(row["Is it the LastOperation attribute?"]).strip().upper() == "YES"
+        
+        is_timestamp = False
+        if "Is it the Timestamp attribute?" in row and pd.notna(row["Is it the Timestamp attribute?"]):
+            is_timestamp = str(row["Is it the Timestamp attribute?"]).strip().upper() == "YES"
+        
+        column_info = {
+            'name': column_name,
+            'quoted_name': quoted_column_name,
+            'data_type': mapped_data_type,
+            'is_primary_key': is_primary_key,
+            'is_last_operation': is_last_operation,
+            'is_timestamp': is_timestamp,
+            'is_foreign_key': False,
+            'not_null': is_primary_key
+        }
+        
+        if is_primary_key:
+            table_info[table_name]['primary_keys'].append(quoted_column_name)
+        
+        table_info[table_name]['columns'].append(column_info)
+        
+        # Process foreign keys
+        ref_table_idx = None
+        ref_attr_idx = None
+        
+        for col_idx, col_name in enumerate(df_metadata.columns):
+            col_name_str = str(col_name).lower()
+            if "reference" in col_name_str and "table" in col_name_str:
+                ref_table_idx = col_idx
+            if "reference" in col_name_str and "attribute" in col_name_str:
+                ref_attr_idx = col_idx
+        
+        if ref_table_idx is None and len(row) > 11:
+            if pd.notna(row.iloc[11]):
+                ref_table_idx = 11
+        
+        if ref_attr_idx is None and len(row) > 12:
+            if pd.notna(row.iloc[12]):
+                ref_attr_idx = 12
+        
+        if ref_table_idx is not None and ref_attr_idx is not None:
+            if ref_table_idx < len(row) and ref_attr_idx < len(row):
+                if pd.notna(row.iloc[ref_table_idx]) and pd.notna(row.iloc[ref_attr_idx]):
+                    ref_table = normalize_name(row.iloc[ref_table_idx])
+                    ref_column = normalize_name(row.iloc[ref_attr_idx])
+                    
+                    if ref_table and ref_column:
+                        if '|' in ref_table and '|' in ref_column:
+                            ref_tables = ref_table.split('|')
+                            ref_columns = ref_column.split('|')
+                            
+                            for i in range(min(len(ref_tables), len(ref_columns))):
+                                rt = normalize_name(ref_tables[i])
+                                rc = normalize_name(ref_columns[i])
+                                
+                                if rt and rc and rt.lower() != "nan" and rc.lower() != "nan":
+                                    column_info['is_foreign_key'] = True
+                                    column_info['not_null'] = True
+                                    all_table_names.add(rt)
+                                    foreign_keys.append({
+                                        'source_table': table_name,
+                                        'source_column': column_name,
+                                        'target_table': rt,
+                                        'target_column': rc
+                                    })
+                        else:
+                            if ref_table.lower() != "nan" and ref_column.lower() != "nan":
+                                column_info['is_foreign_key'] = True
+                                column_info['not_null'] = True
+                                all_table_names.add(ref_table)
+                                foreign_keys.append({
+                                    'source_table': table_name,
+                                    'source_column': column_name,
+                                    'target_table': ref_table,
+                                    'target_column': ref_column
+                                })
+
+    return {
+        'table_info': table_info,
+        'foreign_keys': foreign_keys,
+        'schemas_to_create': schemas_to_create,
+        'oracle_schemas_to_create': oracle_schemas_to_create
+    }
+
+
+def valid_schemas(schemas):
+    """Schemas that actually produce CREATE statements (both paths validate the same way)"""
+    import re
+    return {schema for schema in schemas if re.match(r'^[a-zA-Z_][a-zA-Z0-9_]*$', schema)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200000)
+    parser.add_argument("--db-type", default="POSTGRESQL")
+    args = parser.parse_args()
+
+    df_metadata = make_metadata(args.rows)
+
+    start = time.perf_counter()
+    legacy = legacy_build_metadata_model(df_metadata, args.db_type)
+    legacy_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    columnar = build_metadata_model(df_metadata, args.db_type)
+    columnar_elapsed = time.perf_counter() - start
+
+    legacy_tables = [
+        (table_name, Table.from_columns(info['schema'], info['columns']))
+        for table_name, info in legacy['table_info'].items()
+    ]
+    assert legacy_tables == list(columnar['table_info'].items())
+    # The legacy path only dropped unresolvable references while emitting the ALTERs
+    legacy_columns = {
+        (table_name, col['name'])
+        for table_name, info in legacy['table_info'].items()
+        for col in info['columns']
+    }
+    legacy_foreign_keys = [
+        fk for fk in legacy['foreign_keys']
+        if (fk['target_table'], fk['target_column']) in legacy_columns
+    ]
+    assert [ForeignKey(**fk) for fk in legacy_foreign_keys] == columnar['foreign_keys']
+    for key in ('schemas_to_create', 'oracle_schemas_to_create'):
+        assert valid_schemas(legacy[key]) == valid_schemas(columnar[key])
+
+    print(f"rows={args.rows} db_type={args.db_type}")
+    print(f"iterrows loop: {legacy_elapsed:.3f}s")
+    print(f"columnar:      {columnar_elapsed:.3f}s ({legacy_elapsed / columnar_elapsed:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
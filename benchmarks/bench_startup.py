@@ -0,0 +1,99 @@
+"""Measures the import time of the app module with python -X importtime, and writes JSON.
+
+Usage: python benchmarks/bench_startup.py [--runs 5] [--top 15] [--output startup.json]
+
+Each run is a fresh interpreter. Three scenarios are measured: "import main" (library and
+CLI use), "main.app" (a web worker's cold start, Flask included) and "main.warm_up()"
+(everything a conversion needs, as preloaded in the gunicorn master). For each one the
+JSON has the median wall time, the median cumulative import time of the main module and
+the slowest direct and top-level imports of the median run.
+"""
+import argparse
+import json
+import os
+import platform
+import re
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SCENARIOS = {
+    "import": "import main",
+    "app": "import main; main.app",
+    "warm_up": "import main; main.warm_up()",
+}
+IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+def parse_importtime(stderr):
+    """Returns [(module, self_us, cumulative_us, depth)] from -X importtime output"""
+    modules = []
+    for line in stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            modules.append((module, int(self_us), int(cumulative_us), len(indent) // 2))
+    return modules
+
+
+def run_scenario(code):
+    """Runs the code in a fresh interpreter, returns (wall seconds, parsed importtime lines)"""
+    start = time.perf_counter()
+    completed = subprocess.run([sys.executable, "-X", "importtime", "-c", code], cwd=ROOT,
+                               capture_output=True, text=True, check=True)
+    return time.perf_counter() - start, parse_importtime(completed.stderr)
+
+
+def summarize(runs, top):
+    walls = [wall for wall, _ in runs]
+    median_run = sorted(runs, key=lambda run: run[0])[len(runs) // 2]
+    # Modules imported by main (depth 1) and lazily at top level (depth 0, e.g. pandas on warm-up)
+    top_level = [module for module in median_run[1] if module[3] <= 1]
+    main_times = [cumulative for _, modules in runs for name, _, cumulative, _ in modules if name == "main"]
+    return {
+        'wall_seconds': round(statistics.median(walls), 4),
+        'wall_seconds_min': round(min(walls), 4),
+        'main_import_seconds': round(statistics.median(main_times) / 1e6, 4) if main_times else None,
+        'modules_imported': len(median_run[1]),
+        'slowest_imports': [
+            {'module': name, 'cumulative_seconds': round(cumulative / 1e6, 4)}
+            for name, _, cumulative, _ in sorted(top_level, key=lambda module: -module[2])[:top]
+        ],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15, help="Number of slowest imports to report")
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS))
+    parser.add_argument("--output", default="-", help="JSON results file, or '-' for stdout")
+    args = parser.parse_args()
+
+    results = {}
+    for name in args.scenarios.split(","):
+        runs = [run_scenario(SCENARIOS[name]) for _ in range(args.runs)]
+        results[name] = summarize(runs, args.top)
+        print(f"{name:<8} wall {results[name]['wall_seconds']:.3f}s  "
+              f"main {results[name]['main_import_seconds']:.3f}s", file=sys.stderr)
+
+    report = {
+        'created_at': time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'runs': args.runs,
+        'scenarios': results,
+    }
+    if args.output == "-":
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    else:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
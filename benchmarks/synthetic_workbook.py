@@ -0,0 +1,107 @@
+"""Writes synthetic data-dictionary workbooks in the layout read_workbook expects.
+
+Usage: python benchmarks/synthetic_workbook.py out.xlsx [--rows 100000] [--columns-per-table 20]
+                                               [--fk-density 0.1] [--composite-ratio 0.2] [--no-schema-column]
+
+The "Dataset Overview" sheet carries the target database in cell B14, and the
+"Metadata" sheet has four title rows before the header (skiprows=4). Rows are streamed
+with openpyxl's write-only mode, so even 1M-row workbooks are written in bounded memory.
+"""
+import argparse
+import random
+
+from openpyxl import Workbook
+
+METADATA_HEADER = [
+    "Table Name",
+    "Attribute Name",
+    "Data Type and Length",
+    "Is it the Primary Key or part of the Primary Key?",
+    "Is it the LastOperation attribute?",
+    "Is it the Timestamp attribute?",
+    "Reference Table",
+    "Reference Attribute",
+]
+TABLE_SCHEMA_HEADER = "Table Schema"
+
+RAW_TYPES = ["varchar", "VARCHAR(50)", "nvarchar(100)", "int", "bigint", "smallint", "decimal",
+             "DECIMAL(18,4)", "numeric(10,2)", "date", "datetime", "timestamp", "text", "boolean",
+             "money", "char(3)", None]
+SCHEMAS = ["dbo", "sales", "finance", None]
+
+
+def iter_metadata_rows(rows, columns_per_table=20, fk_density=0.1, composite_ratio=0.2,
+                       schema_column=True, seed=0):
+    """Yields Metadata rows: a primary key per table, CDC/flag columns and references to earlier tables"""
+    rng = random.Random(seed)
+    for i in range(rows):
+        table_idx, col_idx = divmod(i, columns_per_table)
+        reference_table = reference_attribute = None
+        if table_idx and col_idx > 1 and rng.random() < fk_density:
+            target = rng.randrange(table_idx)
+            if rng.random() < composite_ratio and target + 1 < table_idx:
+                reference_table = f"table_{target}|table_{target + 1}"
+                reference_attribute = "column_0|column_0"
+            else:
+                reference_table = f"table_{target}"
+                reference_attribute = "column_0"
+
+        row = [
+            f"table_{table_idx}",
+            "CDC_TS" if col_idx == 1 else f"column_{col_idx}",
+            rng.choice(RAW_TYPES),
+            "YES" if col_idx == 0 else "NO",
+            "YES" if col_idx == columns_per_table - 1 else "NO",
+            "YES" if col_idx == columns_per_table - 2 else "NO",
+            reference_table,
+            reference_attribute,
+        ]
+        if schema_column:
+            row.append(SCHEMAS[table_idx % len(SCHEMAS)])
+        yield row
+
+
+def write_workbook(path, rows, db_type=None, columns_per_table=20, fk_density=0.1, composite_ratio=0.2,
+                   schema_column=True, seed=0):
+    """Writes a workbook with the given number of Metadata rows to path"""
+    workbook = Workbook(write_only=True)
+
+    overview = workbook.create_sheet("Dataset Overview")
+    overview.append(["Field", "Value"])
+    for i in range(14):
+        # Row 14 (after the header row), the cell read through OVERVIEW_DB_TYPE_ROW/COL
+        overview.append([f"Field {i + 1}", db_type if i == 12 else None])
+
+    metadata = workbook.create_sheet("Metadata")
+    metadata.append(["Synthetic data dictionary"])
+    metadata.append([f"{rows} attributes"])
+    metadata.append([])
+    metadata.append([])
+    metadata.append(METADATA_HEADER + ([TABLE_SCHEMA_HEADER] if schema_column else []))
+    for row in iter_metadata_rows(rows, columns_per_table, fk_density, composite_ratio, schema_column, seed):
+        metadata.append(row)
+
+    workbook.save(path)
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("output")
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--db-type", default=None, help="Database named in the Dataset Overview sheet")
+    parser.add_argument("--columns-per-table", type=int, default=20)
+    parser.add_argument("--fk-density", type=float, default=0.1,
+                        help="Share of non-key columns that reference an earlier table")
+    parser.add_argument("--composite-ratio", type=float, default=0.2,
+                        help="Share of references that are composite ('|'-separated)")
+    parser.add_argument("--no-schema-column", action="store_true", help="Leave out the Table Schema column")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    write_workbook(args.output, args.rows, args.db_type, args.columns_per_table, args.fk_density,
+                   args.composite_ratio, not args.no_schema_column, args.seed)
+
+
+if __name__ == "__main__":
+    main()
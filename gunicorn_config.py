@@ -0,0 +1,29 @@
+"""Optional gunicorn settings that import the heavy dependencies once, before the workers fork.
+
+Usage: gunicorn -c gunicorn_config.py main:app
+
+Background jobs (POST /jobs) live in the memory of the worker that accepted them, so this
+config runs one worker process with several threads. With WEB_CONCURRENCY above 1, a job
+poll that reaches another worker answers 404; only raise it when the jobs API is not used.
+"""
+import os
+import time
+
+import main
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '10000')}"
+workers = int(os.environ.get("WEB_CONCURRENCY", 1))
+worker_class = "gthread"
+threads = int(os.environ.get("GUNICORN_THREADS", 8))
+# Import main:app in the master so the workers inherit it
+preload_app = True
+
+
+def on_starting(server):
+    if server.cfg.workers > 1:
+        server.log.warning("Running %d workers: background jobs are only visible to the worker that accepted "
+                           "them, so GET /jobs/<id> may answer 404. Use WEB_CONCURRENCY=1 with the jobs API.",
+                           server.cfg.workers)
+    start = time.perf_counter()
+    main.warm_up()
+    server.log.info("Warmed up conversion dependencies in %.2fs", time.perf_counter() - start)
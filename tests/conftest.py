@@ -0,0 +1,29 @@
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import main  # noqa: E402
+
+METADATA_HEADER = ["Table Name", "Attribute Name", "Data Type and Length", main.PRIMARY_KEY_COLUMN,
+                   main.LAST_OPERATION_COLUMN, main.TIMESTAMP_COLUMN, "Reference Table", "Reference Attribute",
+                   "Table Schema"]
+
+
+def metadata_frame(rows):
+    """Metadata sheet from (table, column, type, is_pk, ref_table, ref_column, schema) tuples"""
+    return pd.DataFrame(
+        [[table, column, data_type, "YES" if is_pk else "NO", "NO", "NO", ref_table, ref_column, schema]
+         for table, column, data_type, is_pk, ref_table, ref_column, schema in rows],
+        columns=METADATA_HEADER
+    )
+
+
+@pytest.fixture
+def build_model():
+    def build(rows, db_type="POSTGRESQL"):
+        return main.build_metadata_model(metadata_frame(rows), db_type)
+    return build
@@ -0,0 +1,101 @@
+import os
+
+import pytest
+
+import main
+
+MODEL_ROWS = [
+    ("customers", "id", "int", True, None, None, "crm"),
+    ("customers", "email", "varchar(100)", False, None, None, "crm"),
+    ("orders", "id", "int", True, None, None, "crm"),
+    ("orders", "customer_id", "int", False, "customers", "id", "crm"),
+    ("order_lines", "order_id", "int", True, "orders", "id", "crm"),
+    ("order_lines", "line", "int", True, None, None, "crm"),
+    ("order_lines", "amount", "decimal(10,2)", False, None, None, "crm"),
+    ("audit", "id", "bigint", True, None, None, None),
+    ("audit", "changed_at", "timestamp", False, None, None, None),
+]
+
+
+def apply_sqlite(tmp_path, model, db_type="POSTGRESQL", **kwargs):
+    target = f"sqlite:///{tmp_path / 'check.db'}"
+    connect = main.connect_target(target, main.model_schemas(model))
+    return main.apply_model(db_type, model, connect, workers=main.target_workers(target), sqlite=True, **kwargs)
+
+
+def test_known_good_model_applies_without_failures(tmp_path, build_model):
+    results = apply_sqlite(tmp_path, build_model(MODEL_ROWS))
+
+    assert [result for result in results if not result['ok']] == []
+    summary = main.summarize_apply(results)
+    assert summary['tables']['ok'] == 4
+    assert summary['foreign_keys'] == {'ok': 2, 'failed': 0, 'skipped': 0, 'seconds': summary['foreign_keys']['seconds']}
+    assert summary['verify']['ok'] == 4
+
+
+def test_foreign_key_to_a_column_without_key_fails(tmp_path, build_model):
+    model = build_model(MODEL_ROWS + [("refunds", "id", "int", True, None, None, "crm"),
+                                      ("refunds", "email", "varchar(100)", False, "customers", "email", "crm")])
+    failures = [result for result in apply_sqlite(tmp_path, model) if not result['ok']]
+
+    assert [(result['phase'], result['object']) for result in failures] == [("foreign_keys", "refunds")]
+    assert "foreign key mismatch" in failures[0]['error']
+
+
+def test_foreign_keys_between_schemas_are_skipped(tmp_path, build_model):
+    model = build_model(MODEL_ROWS + [("audit", "order_id", "int", False, "orders", "id", None)])
+    results = apply_sqlite(tmp_path, model)
+
+    assert all(result['ok'] for result in results)
+    assert [result['object'] for result in results if result['skipped']] == ["FK_3"]
+
+
+def test_failures_do_not_stop_the_run(tmp_path, build_model):
+    model = build_model(MODEL_ROWS)
+    apply_sqlite(tmp_path, model, phases=["tables"])
+    results = apply_sqlite(tmp_path, model, phases=["tables", "verify"])
+
+    assert [result['ok'] for result in results if result['phase'] == "tables"] == [False] * 4
+    assert all(result['ok'] for result in results if result['phase'] == "verify")
+
+
+def test_schemas_phase_creates_the_model_schemas(build_model):
+    model = build_model(MODEL_ROWS)
+    statements = [statement for batch in main.iter_apply_batches("POSTGRESQL", model, "schemas") for _, statement in batch]
+    assert statements == ['CREATE SCHEMA IF NOT EXISTS "NIC_DWH_STG"', 'CREATE SCHEMA IF NOT EXISTS "crm"']
+
+
+def test_split_sql_statements_keeps_block_terminators():
+    script = ("-- Create schema\nIF NOT EXISTS (SELECT 1)\nBEGIN\n    EXEC('CREATE SCHEMA s')\nEND;\n"
+              "DROP USER x CASCADE;\n\nCREATE USER \"x\" IDENTIFIED BY 123456;")
+    assert main.split_sql_statements(script) == [
+        "IF NOT EXISTS (SELECT 1)\nBEGIN\n    EXEC('CREATE SCHEMA s')\nEND;",
+        "DROP USER x CASCADE",
+        'CREATE USER "x" IDENTIFIED BY 123456',
+    ]
+
+
+@pytest.mark.skipif(not os.environ.get("DDL_TEST_POSTGRES_URL"), reason="DDL_TEST_POSTGRES_URL is not set")
+def test_known_good_model_applies_to_postgresql(build_model):
+    """Needs an empty scratch database, e.g. from `docker run -e POSTGRES_PASSWORD=postgres -p 5432:5432 postgres`"""
+    model = build_model(MODEL_ROWS)
+    target = os.environ["DDL_TEST_POSTGRES_URL"]
+    connect = main.connect_target(target)
+    schemas = main.model_schemas(model)
+    # Start from a database without the model's schemas, the schemas phase creates them
+    conn = connect()
+    try:
+        with conn.cursor() as cursor:
+            for schema in schemas:
+                cursor.execute(f'DROP SCHEMA IF EXISTS "{schema}" CASCADE')
+        conn.commit()
+    finally:
+        conn.close()
+
+    results = main.apply_model("POSTGRESQL", model, connect)
+
+    assert [result for result in results if not result['ok']] == []
+    summary = main.summarize_apply(results)
+    assert summary['schemas']['ok'] == len(schemas)
+    assert summary['primary_keys']['ok'] == 4
+    assert summary['foreign_keys']['ok'] == 2
@@ -0,0 +1,55 @@
+import main
+from conftest import metadata_frame
+
+ROWS = [
+    ("customers", "id", "int", True, None, None, "crm"),
+    ("orders", "id", "int", True, None, None, "sales"),
+    ("orders", "customer_id", "int", False, "customers", "id", "sales"),
+]
+
+
+def write_metadata(tmp_path):
+    path = tmp_path / "metadata.csv"
+    metadata_frame(ROWS).to_csv(path, index=False)
+    return str(path)
+
+
+def test_scripts_over_the_entry_limit_are_streamed_but_not_cached(tmp_path):
+    path = write_metadata(tmp_path)
+    cache = main.ResultCache(max_ddl_size=64)
+
+    script = "".join(cache.iter_ddl("POSTGRESQL", path, chunk_size=16))
+
+    assert script == main.generate_ddl("POSTGRESQL", path)
+    assert cache.ddl.stats()['entries'] == 0
+
+
+def test_disk_tier_keeps_to_its_byte_budget(tmp_path):
+    cache = main.TTLCache(2**20, 60, cache_dir=str(tmp_path), disk_max_size=2500)
+
+    for i in range(5):
+        cache.put(i, "x" * 1000)
+    cache.prune_disk()
+
+    assert sum(entry.stat().st_size for entry in tmp_path.iterdir()) <= 2500
+    cache.clear()
+    assert cache.get(4) == "x" * 1000
+    assert cache.get(0) is None
+
+
+def test_dialect_switch_reuses_the_parsed_workbook_but_not_the_ddl(tmp_path):
+    path = write_metadata(tmp_path)
+    cache = main.ResultCache()
+    postgresql = "".join(cache.iter_ddl("POSTGRESQL", path))
+    workbooks, ddl = cache.workbooks.stats(), cache.ddl.stats()
+
+    oracle = "".join(cache.iter_ddl("ORACLE", path))
+
+    assert cache.workbooks.stats()['hits'] > workbooks['hits']
+    assert cache.workbooks.stats()['misses'] == workbooks['misses']
+    assert cache.ddl.stats()['misses'] == ddl['misses'] + 1
+    assert cache.ddl.stats()['hits'] == ddl['hits']
+    assert oracle == main.generate_ddl("ORACLE", path) != postgresql
+
+    assert "".join(cache.iter_ddl("ORACLE", path)) == oracle
+    assert cache.ddl.stats()['hits'] == ddl['hits'] + 1
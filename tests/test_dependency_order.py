@@ -0,0 +1,38 @@
+import main
+
+ROWS = [
+    # a and b reference each other, c references a, and audit references zone which sorts after it
+    ("a", "id", "int", True, None, None, "s"),
+    ("a", "b_id", "int", False, "b", "id", "s"),
+    ("b", "id", "int", True, None, None, "s"),
+    ("b", "a_id", "int", False, "a", "id", "s"),
+    ("c", "id", "int", True, None, None, "s"),
+    ("c", "a_id", "int", False, "a", "id", "s"),
+    ("audit", "id", "int", True, None, None, "s"),
+    ("audit", "zone_id", "int", False, "zone", "id", "s"),
+    ("zone", "id", "int", True, None, None, "s"),
+]
+
+
+def statements(model):
+    return [s.strip() for s in main.iter_ddl_statements("POSTGRESQL", model, dependency_order=True)
+            if s.strip() and not s.lstrip().startswith("--")]
+
+
+def test_tables_are_created_after_the_tables_they_reference(build_model):
+    creates = [s.split('"')[3] for s in statements(build_model(ROWS)) if s.startswith("CREATE TABLE")]
+
+    assert creates.index("zone") < creates.index("audit")
+    assert creates.index("a") < creates.index("c")
+
+
+def test_only_foreign_keys_in_a_cycle_are_deferred(build_model):
+    ddl = statements(build_model(ROWS))
+    alters = [s for s in ddl if s.startswith("ALTER TABLE")]
+    creates = {s.split('"')[3]: s for s in ddl if s.startswith("CREATE TABLE")}
+
+    assert sorted(s.split('"')[3] for s in alters) == ["a", "b"]
+    assert all("FOREIGN KEY" in s for s in alters)
+    assert 'FOREIGN KEY ("a_id") REFERENCES "s"."a"("id")' in creates["c"]
+    assert 'FOREIGN KEY ("zone_id") REFERENCES "s"."zone"("id")' in creates["audit"]
+    assert "FOREIGN KEY" not in creates["a"] and "FOREIGN KEY" not in creates["b"]
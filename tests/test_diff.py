@@ -0,0 +1,66 @@
+import main
+
+CUSTOMERS = [
+    ("customers", "id", "int", True, None, None, "crm"),
+    ("customers", "email", "varchar(100)", False, None, None, "crm"),
+]
+ORDERS = [
+    ("orders", "id", "int", True, None, None, "crm"),
+    ("orders", "customer_id", "int", False, "customers", "id", "crm"),
+]
+
+
+def diff_ddl(old_model, new_model, db_type="POSTGRESQL"):
+    return list(main.iter_diff_statements(db_type, old_model, new_model))
+
+
+def test_unchanged_model_has_no_statements(build_model):
+    model = build_model(CUSTOMERS + ORDERS)
+    statements = [s for s in diff_ddl(model, build_model(CUSTOMERS + ORDERS)) if not s.lstrip().startswith("--")]
+    assert statements == []
+
+
+def test_added_column(build_model):
+    old = build_model(CUSTOMERS + ORDERS)
+    new = build_model(CUSTOMERS + [("customers", "phone", "varchar(20)", False, None, None, "crm")] + ORDERS)
+    assert 'ALTER TABLE "crm"."customers" ADD COLUMN "phone" VARCHAR(20);' in diff_ddl(old, new)
+
+
+def test_primary_key_change_drops_referencing_foreign_keys_first(build_model):
+    old = build_model(CUSTOMERS + ORDERS)
+    new = build_model([
+        ("customers", "id", "int", True, None, None, "crm"),
+        ("customers", "email", "varchar(100)", True, None, None, "crm"),
+    ] + ORDERS)
+
+    diff = main.diff_models(old, new)
+    assert [fk.source_table for fk, _ in diff['dropped_foreign_keys']] == ["orders"]
+    assert [fk.source_table for fk in diff['added_foreign_keys']] == ["orders"]
+
+    statements = diff_ddl(old, new)
+    drop_fk = statements.index('ALTER TABLE "crm"."orders" DROP CONSTRAINT FK_1;')
+    drop_pk = statements.index('ALTER TABLE "crm"."customers" DROP CONSTRAINT PK_customers;')
+    add_pk = statements.index('ALTER TABLE "crm"."customers" ADD CONSTRAINT PK_customers PRIMARY KEY ("id", "email");')
+    add_fk = next(i for i, s in enumerate(statements) if s.startswith('ALTER TABLE "crm"."orders" ADD CONSTRAINT FK_'))
+    assert drop_fk < drop_pk < add_pk < add_fk
+
+
+def test_primary_key_change_keeps_unrelated_foreign_keys(build_model):
+    products = [("products", "id", "int", True, None, None, "crm"),
+                ("products", "customer_id", "int", False, "customers", "id", "crm")]
+    old = build_model(CUSTOMERS + ORDERS + products)
+    new = build_model(CUSTOMERS + ORDERS + [("products", "id", "int", True, None, None, "crm"),
+                                            ("products", "sku", "varchar(20)", True, None, None, "crm"),
+                                            ("products", "customer_id", "int", False, "customers", "id", "crm")])
+    diff = main.diff_models(old, new)
+    assert diff['dropped_foreign_keys'] == []
+    assert diff['added_foreign_keys'] == []
+
+
+def test_moved_table_is_rebuilt_with_its_foreign_keys(build_model):
+    old = build_model(CUSTOMERS + ORDERS)
+    new = build_model([(t, c, d, pk, rt, rc, "sales" if t == "customers" else s)
+                       for t, c, d, pk, rt, rc, s in CUSTOMERS] + ORDERS)
+    diff = main.diff_models(old, new)
+    assert diff['moved_tables'] == ["customers"]
+    assert len(diff['dropped_foreign_keys']) == 1 and len(diff['added_foreign_keys']) == 1
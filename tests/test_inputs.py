@@ -0,0 +1,68 @@
+import importlib.util
+
+import pandas as pd
+
+import cli
+import main
+from conftest import metadata_frame
+
+ROWS = [
+    ("customers", "id", "int", True, None, None, "crm"),
+    ("customers", "note", "NULL", False, None, None, "crm"),
+    ("orders", "customer_id", "int", False, "customers", "id", "crm"),
+]
+
+
+def export(tmp_path, extension):
+    frame = metadata_frame(ROWS).assign(Owner="data team")
+    path = tmp_path / f"metadata{extension}"
+    if extension == ".csv":
+        frame.to_csv(path, index=False)
+    else:
+        frame.to_json(path, orient="records", lines=True)
+    return str(path)
+
+
+def test_csv_and_jsonl_exports_build_the_same_model(tmp_path):
+    models = [main.read_metadata_model("POSTGRESQL", export(tmp_path, extension))[1]
+              for extension in (".csv", ".jsonl")]
+
+    assert models[0]['table_info'] == models[1]['table_info']
+    assert models[0]['foreign_keys'] == models[1]['foreign_keys']
+    assert models[0]['table_info']["customers"].data_types == ("INTEGER", "NULL")
+
+
+def test_columns_outside_the_contract_are_skipped(tmp_path):
+    for extension in (".csv", ".jsonl"):
+        assert "Owner" not in main.read_workbook(export(tmp_path, extension))['metadata'].columns
+
+
+def test_nullable_boolean_flags(tmp_path):
+    rows = [
+        {"Table Name": "customers", "Attribute Name": "id", main.PRIMARY_KEY_COLUMN: True},
+        {"Table Name": "customers", "Attribute Name": "email"},
+        {"Table Name": "customers", "Attribute Name": "changed_at", main.TIMESTAMP_COLUMN: True},
+        {"Table Name": "customers", "Attribute Name": "op", main.LAST_OPERATION_COLUMN: False},
+    ]
+    path = tmp_path / "metadata.jsonl"
+    pd.DataFrame(rows).to_json(path, orient="records", lines=True)
+    paths = [str(path)]
+    if importlib.util.find_spec("pyarrow") is not None:
+        paths.append(str(tmp_path / "metadata.parquet"))
+        pd.DataFrame(rows).to_parquet(paths[-1])
+
+    for path in paths:
+        customers = main.read_metadata_model("POSTGRESQL", path)[1]['table_info']["customers"]
+        assert customers.primary_keys == ["id"], path
+        assert [col.name for col in customers.columns if col.is_timestamp] == ["changed_at"], path
+        assert not any(col.is_last_operation for col in customers.columns), path
+
+
+def test_batch_fails_only_the_inputs_writing_to_the_same_output(tmp_path):
+    csv, jsonl = export(tmp_path, ".csv"), export(tmp_path, ".jsonl")
+    metadata_frame(ROWS).to_csv(tmp_path / "other.csv", index=False)
+
+    results = cli.run_batch([csv, jsonl, str(tmp_path / "other.csv")], "POSTGRESQL", str(tmp_path / "ddl"))
+
+    assert [error is not None for _, _, _, error in results] == [True, True, False]
+    assert (tmp_path / "ddl" / "other.sql").exists()
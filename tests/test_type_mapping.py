@@ -0,0 +1,31 @@
+import pytest
+
+import main
+
+
+@pytest.mark.parametrize("db_type, data_type, expected", [
+    ("POSTGRESQL", "varchar(50)", "VARCHAR(50)"),
+    ("ORACLE", "decimal(10,2)", "NUMBER(10,2)"),
+    ("POSTGRESQL", "nvarchar(max)", "TEXT"),
+    ("SQL_SERVER", "varchar(max)", "VARCHAR(MAX)"),
+    ("MYSQL", "int(11)", "INT"),
+    ("POSTGRESQL", "float", "REAL"),
+    ("POSTGRESQL", "float(53)", "FLOAT(53)"),
+    ("MYSQL", "float(53)", "FLOAT(53)"),
+    ("SQL_SERVER", "float(53)", "FLOAT(53)"),
+    ("ORACLE", "float(53)", "FLOAT(53)"),
+    ("SQL_SERVER", "datetime2(3)", "DATETIME2(3)"),
+    ("POSTGRESQL", "datetime2(7)", "TIMESTAMP(6)"),
+    ("MYSQL", "time(3)", "TIME(3)"),
+    ("ORACLE", "timestamp(9)", "TIMESTAMP(9)"),
+    ("MYSQL", "timestamp(3)", "TIMESTAMP(3) DEFAULT CURRENT_TIMESTAMP(3)"),
+    ("ORACLE", "time(3)", "DATE"),
+    ("POSTGRESQL", "geometry(point)", "GEOMETRY(POINT)"),
+])
+def test_map_data_type(db_type, data_type, expected):
+    assert main.map_data_type(db_type, data_type) == expected
+
+
+def test_mysql_timestamp_default_matches_precision():
+    col = main.Column("changed_at", "DATETIME(3)", main.column_flags(is_timestamp=True))
+    assert main.render_column_definition(col, "MYSQL") == "`changed_at` DATETIME(3) DEFAULT CURRENT_TIMESTAMP(3)"
@@ -0,0 +1,89 @@
+import io
+import json
+import time
+import zipfile
+
+import pytest
+
+import main
+from conftest import metadata_frame
+
+ROWS = [
+    ("customers", "id", "int", True, None, None, "crm"),
+    ("orders", "id", "int", True, None, None, "sales"),
+    ("orders", "customer_id", "int", False, "customers", "id", "sales"),
+]
+
+
+@pytest.fixture
+def client():
+    return main.create_app().test_client()
+
+
+def upload(client, **form):
+    csv = metadata_frame(ROWS).to_csv(index=False).encode("utf-8")
+    return client.post("/", data=dict(form, file=(io.BytesIO(csv), "metadata.csv")),
+                       content_type="multipart/form-data")
+
+
+def run_job(client, **form):
+    """Submits a job, polls it until it finishes and returns (final status, result response)"""
+    csv = metadata_frame(ROWS).to_csv(index=False).encode("utf-8")
+    response = client.post("/jobs", data=dict(form, file=(io.BytesIO(csv), "metadata.csv")),
+                           content_type="multipart/form-data")
+    assert response.status_code == 202
+    status_url = response.get_json()['status_url']
+    deadline = time.monotonic() + 30
+    status = client.get(status_url).get_json()
+    while status['status'] in ("queued", "running") and time.monotonic() < deadline:
+        time.sleep(0.01)
+        status = client.get(status_url).get_json()
+    return status, client.get(f"{status_url}/result")
+
+
+def test_shard_by_schema_returns_a_zip_with_manifest(client):
+    response = upload(client, db_type="POSTGRESQL", shard_by="schema")
+    archive = zipfile.ZipFile(io.BytesIO(response.get_data()))
+    manifest = json.loads(archive.read("manifest.json"))
+
+    assert manifest['order'] == [["000_schemas.sql"], ["001_crm.sql"], ["002_sales.sql"]]
+    assert manifest['files']["002_sales.sql"]['depends_on'] == ["001_crm.sql"]
+
+
+def test_shard_by_with_all_databases_is_an_error(client):
+    response = upload(client, db_type="ALL", shard_by="schema")
+    assert response.get_data(as_text=True).startswith("Error: Sharded output needs a single database type")
+
+
+def test_unknown_db_type_is_counted_as_other(client):
+    client.post("/", data={'db_type': "NOT_A_DB\n", 'file': (io.BytesIO(b"not a workbook"), "metadata.xlsx")},
+                content_type="multipart/form-data")
+    metrics = client.get("/metrics").get_data(as_text=True)
+
+    assert 'ddl_errors_total{db_type="other",source="request"}' in metrics
+    assert "NOT_A_DB" not in metrics
+
+
+def test_job_result_matches_generate_ddl(client, tmp_path):
+    path = tmp_path / "metadata.csv"
+    metadata_frame(ROWS).to_csv(path, index=False)
+
+    status, result = run_job(client, db_type="POSTGRESQL")
+
+    assert status['status'] == "done"
+    assert (status['rows_processed'], status['tables_emitted'], status['dialects_done']) == (3, 2, 1)
+    assert result.get_data(as_text=True) == main.generate_ddl("POSTGRESQL", str(path))
+
+
+def test_job_for_all_databases_counts_each_dialect(client, tmp_path):
+    path = tmp_path / "metadata.csv"
+    metadata_frame(ROWS).to_csv(path, index=False)
+
+    status, result = run_job(client, db_type="ALL")
+    archive = zipfile.ZipFile(io.BytesIO(result.get_data()))
+
+    assert status['status'] == "done"
+    assert status['dialects_done'] == status['dialects_total'] == len(main.SUPPORTED_DB_TYPES)
+    assert status['rows_processed'] == status['rows_total'] == 3 * len(main.SUPPORTED_DB_TYPES)
+    for db_type in main.SUPPORTED_DB_TYPES:
+        assert archive.read(f"ddl_{db_type.lower()}.sql").decode("utf-8") == main.generate_ddl(db_type, str(path))